@@ -1,9 +1,67 @@
 import ujson as json
+from datetime import datetime
 from django.conf import settings
-from rest_framework.renderers import JSONRenderer
-from rest_framework_csv.renderers import CSVRenderer
+from rest_framework.renderers import JSONRenderer as BaseJSONRenderer
+from rest_framework.utils.encoders import JSONEncoder as BaseJSONEncoder
+from rest_framework_csv.renderers import CSVRenderer as BaseCSVRenderer
 if settings.USE_GEODB:
     from django.contrib.gis.geos import GEOSGeometry
+from .utils import datetime_to_string
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONEncoder (BaseJSONEncoder):
+    """
+    DRF's json encoder, except that datetimes keep their microseconds (DRF
+    truncates them to milliseconds), so that output matches the orjson path.
+    """
+    def default(self, obj):
+        if isinstance(obj, datetime):
+            return datetime_to_string(obj)
+        return super(JSONEncoder, self).default(obj)
+
+
+class JSONRenderer (BaseJSONRenderer):
+    """
+    Renderer which serializes to compact json using orjson, when it is
+    available. orjson encodes datetimes natively (as RFC 3339 strings, with
+    naive datetimes treated as UTC), so serializers can hand datetime objects
+    straight to the renderer. Indented output (e.g. for the browsable API),
+    ASCII-only output, and anything orjson can't encode fall back to DRF's
+    json encoder, which formats datetimes the same way.
+    """
+    encoder_class = JSONEncoder
+    orjson_options = (orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii:
+            return super(JSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super(JSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.orjson_options)
+        except orjson.JSONEncodeError:
+            return super(JSONRenderer, self).render(data, accepted_media_type, renderer_context)
+
+        # Escape the line separator characters that are valid in JSON but not
+        # in javascript, the same as DRF does.
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class CSVRenderer (BaseCSVRenderer):
+    """
+    Renderer which serializes to CSV, writing datetimes in ISO 8601 format.
+    """
+    def flatten_item(self, item):
+        if isinstance(item, datetime):
+            item = datetime_to_string(item)
+        return super(CSVRenderer, self).flatten_item(item)
 
 
 class JSONPRenderer (JSONRenderer):
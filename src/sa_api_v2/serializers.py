@@ -1,32 +1,70 @@
 """
 DjangoRestFramework resources for the Shareabouts REST API.
 """
-import ujson as json
 import re
 from collections import defaultdict, OrderedDict
-from itertools import chain
+from functools import lru_cache
 from django.conf import settings
 if settings.USE_GEODB:
-    from django.contrib.gis.geos import GEOSGeometry
+    from django.contrib.gis.geos import GEOSGeometry, Point
 from django.core.exceptions import ValidationError
+from django.core.files.storage import FileSystemStorage
 import django.db.models
-from django.utils.http import urlquote_plus
+from django.db.models import Count
+from django.utils.encoding import filepath_to_uri
+from django.utils.http import urlquote
 from rest_framework import pagination
 from rest_framework import serializers
 from rest_framework import response
 from rest_framework_bulk import serializers as bulk_serializers
-# from rest_framework.reverse import reverse
+from rest_framework.reverse import reverse, preserve_builtin_query_params
 
 from . import apikey
 from . import cors
 from . import models
 from .models import check_data_permission
+from .utils import datetime_to_string
 from .params import (INCLUDE_INVISIBLE_PARAM, INCLUDE_PRIVATE_PARAM,
     INCLUDE_SUBMISSIONS_PARAM, FORMAT_PARAM)
 
 import logging
 log = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import ujson
+
+
+def _loads(s):
+    """
+    Parse a JSON string, using orjson when it is available.
+    """
+    if orjson is not None:
+        return orjson.loads(s)
+    return ujson.loads(s)
+
+
+def _loads_blob(blob):
+    """
+    Parse a data blob, unless the ORM has already handed it back as a dict
+    (e.g. from a JSONField).
+    """
+    if isinstance(blob, dict):
+        return blob
+    return _loads(blob)
+
+
+def _dumps(o):
+    """
+    Serialize an object to a JSON string (not bytes), using orjson when it is
+    available.
+    """
+    if orjson is not None:
+        return orjson.dumps(o).decode('utf-8')
+    return ujson.dumps(o)
+
 
 ###############################################################################
 #
@@ -49,16 +87,32 @@ class GeometryField(serializers.Field):
         elif self.format == 'wkt':
             return obj.wkt
         elif self.format == 'dict':
-            return json.loads(obj.json)
+            # Most Shareabouts geometries are 2D points, so build those
+            # directly instead of round-tripping through GeoJSON text.
+            if obj.geom_type == 'Point' and not obj.empty and not obj.hasz:
+                return {'type': 'Point', 'coordinates': [obj.x, obj.y]}
+            return _loads(obj.json)
         else:
             raise ValueError('Cannot output as %s' % self.format)
 
     def to_internal_value(self, data):
-        if not isinstance(data, str):
-            data = json.dumps(data)
-
         try:
-            return GEOSGeometry(data)
+            # WKT and GeoJSON strings go straight to GEOS. GeoJSON points can
+            # be constructed directly, without encoding them as GeoJSON text
+            # for GEOS (and GDAL) to parse again. Points that name a crs, or
+            # whose coordinates are anything but a pair of numbers, are left
+            # for GDAL to interpret (or reject).
+            if isinstance(data, str):
+                return GEOSGeometry(data)
+
+            if isinstance(data, dict) and data.get('type') == 'Point' and 'crs' not in data:
+                coords = data.get('coordinates')
+                if (isinstance(coords, (list, tuple)) and len(coords) == 2 and
+                        all(isinstance(c, (int, float)) and not isinstance(c, bool)
+                            for c in coords)):
+                    return Point(coords[0], coords[1], srid=4326)
+
+            return GEOSGeometry(_dumps(data))
         except Exception as exc:
             raise ValidationError('Problem converting native data to Geometry: %s' % (exc,))
 
@@ -81,7 +135,15 @@ class ShareaboutsFieldMixin (object):
         if isinstance(obj, models.User):
             instance_kwargs = {'owner_username': obj.username}
         else:
-            instance_kwargs = obj.cache.get_cached_instance_params(obj.pk, lambda: obj)
+            # Several URL fields are usually rendered for the same object, so
+            # only fetch its cached parameters once. Values that come from
+            # the object's attributes (e.g. submission_set_name) may change
+            # between fields, so those are still looked up below each time.
+            try:
+                instance_kwargs = obj._instance_params_cache
+            except AttributeError:
+                instance_kwargs = obj.cache.get_cached_instance_params(obj.pk, lambda: obj)
+                obj._instance_params_cache = instance_kwargs
 
         url_kwargs = {}
         for arg_name in self.url_arg_names:
@@ -95,41 +157,68 @@ class ShareaboutsFieldMixin (object):
         return url_kwargs
 
 
-def api_reverse(view_name, kwargs={}, request=None, format=None):
+# Placeholder values substituted for URL arguments when building a URL
+# template. They are all digits so that they satisfy both the \d+ and the
+# [^/]+ patterns used in the API routes.
+URL_ARG_PLACEHOLDER = '918273645%02d'
+
+
+@lru_cache(maxsize=256)
+def get_url_template(view_name, url_arg_names, scheme=None, host=None, format=None):
     """
-    A special case of URL reversal where we know we're getting an API URL. This
-    can be much faster than Django's built-in general purpose regex resolver.
+    Reverse the given view once using placeholder argument values, and split
+    the resulting URL around the placeholders. Returns the literal pieces of
+    the URL, along with the argument name that belongs between each adjacent
+    pair of pieces. The URL resolver only has to be walked once per view,
+    host, and format.
 
     """
-    if request:
-        url = '{}://{}/api/v2'.format(request.scheme, request.get_host())
-    else:
-        url = '/api/v2'
+    arg_names_by_placeholder = dict(
+        (URL_ARG_PLACEHOLDER % index, arg_name)
+        for index, arg_name in enumerate(url_arg_names))
+    url = reverse(view_name, format=format, kwargs=dict(
+        (arg_name, placeholder)
+        for placeholder, arg_name in arg_names_by_placeholder.items()))
+    if host is not None:
+        url = '{}://{}{}'.format(scheme, host, url)
 
-    route_template_strings = {
-        'submission-detail': '/{owner_username}/datasets/{dataset_slug}/places/{place_id}/{submission_set_name}/{submission_id}',
-        'submission-list': '/{owner_username}/datasets/{dataset_slug}/places/{place_id}/{submission_set_name}',
+    if not arg_names_by_placeholder:
+        return (url,), ()
 
-        'place-detail': '/{owner_username}/datasets/{dataset_slug}/places/{place_id}',
-        'place-list': '/{owner_username}/datasets/{dataset_slug}/places',
+    pattern = '(' + '|'.join(map(re.escape, arg_names_by_placeholder)) + ')'
+    parts = re.split(pattern, url)
+    return tuple(parts[0::2]), tuple(arg_names_by_placeholder[p] for p in parts[1::2])
 
-        'dataset-detail': '/{owner_username}/datasets/{dataset_slug}',
-        'user-detail': '/{owner_username}',
-        'dataset-submission-list': '/{owner_username}/datasets/{dataset_slug}/{submission_set_name}',
-    }
 
-    try:
-        route_template_string = route_template_strings[view_name]
-    except KeyError:
-        raise ValueError('No API route named {} formatted.'.format(view_name))
+def template_reverse(view_name, url_arg_names, kwargs, request=None, format=None):
+    """
+    Equivalent to reverse(view_name, kwargs=kwargs, request=request,
+    format=format), but fills in a cached URL template instead of resolving
+    the view for every object. Requests with a versioning scheme go through
+    reverse() itself, since the scheme may rewrite the URL.
 
-    url_params = dict([(key, urlquote_plus(val)) for key,val in kwargs.items()])
-    url += route_template_string.format(**url_params)
+    """
+    if getattr(request, 'versioning_scheme', None) is not None:
+        return reverse(view_name, kwargs=kwargs, request=request, format=format)
+
+    if request is not None:
+        pieces, arg_names = get_url_template(
+            view_name, tuple(url_arg_names), request.scheme, request.get_host(), format)
+    else:
+        pieces, arg_names = get_url_template(
+            view_name, tuple(url_arg_names), format=format)
 
-    if format is not None:
-        url += '.' + format
+    # Fill in all of the arguments in one pass, so that a value that happens
+    # to look like a placeholder is never substituted again.
+    url = [pieces[0]]
+    for arg_name, piece in zip(arg_names, pieces[1:]):
+        url.append(urlquote(str(kwargs[arg_name]), safe="!$&'()*+,;=~:@"))
+        url.append(piece)
+    url = ''.join(url)
+
+    # Carry over the ?format= override, the same as reverse() does.
+    return preserve_builtin_query_params(url, request)
 
-    return url
 
 class ShareaboutsRelatedField (ShareaboutsFieldMixin, serializers.HyperlinkedRelatedField):
     """
@@ -153,9 +242,8 @@ class ShareaboutsRelatedField (ShareaboutsFieldMixin, serializers.HyperlinkedRel
         if pk is None:
             return
 
-        lookup_value = getattr(obj, self.lookup_field)
         kwargs = self.get_url_kwargs(obj)
-        return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+        return template_reverse(view_name, self.url_arg_names, kwargs, request=request, format=format)
 
 
 class DataSetRelatedField (ShareaboutsRelatedField):
@@ -194,9 +282,8 @@ class ShareaboutsIdentityField (ShareaboutsFieldMixin, serializers.HyperlinkedId
         # Unsaved objects will not yet have a valid URL.
         if obj.pk is None: return None
 
-        lookup_value = getattr(obj, self.lookup_field)
         kwargs = self.get_url_kwargs(obj)
-        return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+        return template_reverse(view_name, self.url_arg_names, kwargs, request=request, format=format)
 
 
 class PlaceIdentityField (ShareaboutsIdentityField):
@@ -229,9 +316,54 @@ class DataSetIdentityField (ShareaboutsIdentityField):
     view_name = 'dataset-detail'
 
 
+# Placeholder file name used to build a storage backend's URL template. It is
+# made up only of characters that no storage backend will escape.
+STORAGE_NAME_PLACEHOLDER = '918273645attachment'
+
+# A mapping from storage backend to its URL template (or None, if its URLs
+# cannot be templated).
+_storage_url_templates = {}
+
+
+def get_storage_url_template(storage):
+    """
+    Get a URL template for files in the given storage. The template contains
+    STORAGE_NAME_PLACEHOLDER in place of the file name. Only storage backends
+    whose URLs are a simple function of the file name (the local file system,
+    or S3 without query string auth) can be templated; for any other backend
+    return None.
+    """
+    try:
+        return _storage_url_templates[storage]
+    except KeyError:
+        pass
+
+    if isinstance(storage, FileSystemStorage) or getattr(storage, 'querystring_auth', True) is False:
+        template = storage.url(STORAGE_NAME_PLACEHOLDER)
+        if STORAGE_NAME_PLACEHOLDER not in template:
+            template = None
+    else:
+        # Signed URLs are different for each file and each request.
+        template = None
+
+    _storage_url_templates[storage] = template
+    return template
+
+
+def storage_url(storage, name):
+    """
+    Equivalent to storage.url(name), but fills in a cached URL template when
+    the storage backend allows it.
+    """
+    template = get_storage_url_template(storage)
+    if template is None:
+        return storage.url(name)
+    return template.replace(STORAGE_NAME_PLACEHOLDER, filepath_to_uri(name))
+
+
 class AttachmentFileField (serializers.FileField):
     def to_representation(self, obj):
-        return obj.storage.url(obj.name)
+        return storage_url(obj.storage, obj.name)
 
 
 ###############################################################################
@@ -241,6 +373,27 @@ class AttachmentFileField (serializers.FileField):
 #
 
 
+def is_request_flag_on(request, flagname):
+    """
+    Check whether a flag is turned on in the request's query parameters. A
+    serializer checks the same few flags for every object it serializes, so
+    the results are memoized on the request for as long as its query
+    parameters stay the same.
+    """
+    flag_cache = getattr(request, '_sa_flag_cache', None)
+    if flag_cache is None or flag_cache[0] is not request.GET:
+        flag_cache = (request.GET, {})
+        request._sa_flag_cache = flag_cache
+
+    flags = flag_cache[1]
+    try:
+        return flags[flagname]
+    except KeyError:
+        param = request.GET.get(flagname, 'false')
+        is_on = flags[flagname] = param.lower() not in ('false', 'no', 'off')
+        return is_on
+
+
 class ActivityGenerator (object):
     def _set_silent_flag(self, attrs):
         request = self.context['request']
@@ -269,20 +422,38 @@ class DataBlobProcessor (EmptyModelSerializer):
     'data' JSON blob of arbitrary key/value pairs.
     """
 
+    # A mapping from serializer class to the set of field names that should
+    # not be put into the data blob.
+    _known_fields_cache = {}
+
+    def get_known_fields(self):
+        """
+        Get the names of the fields that the serializer knows about directly.
+        These are the same for every instance of a serializer class, so they
+        are only computed once per class.
+        """
+        cls = type(self)
+        known_fields = cls._known_fields_cache.get(cls)
+        if known_fields is None:
+            known_fields = set(self.fields.keys())
+
+            # And allow an arbitrary value field named 'data' (don't let the
+            # data blob get in the way).
+            known_fields.discard('data')
+
+            known_fields = cls._known_fields_cache.setdefault(cls, frozenset(known_fields))
+        return known_fields
+
     def to_internal_value(self, data):
         """
         Converts a dictionary of data into a dictionary of deserialized fields.
         """
-        blob = json.loads(self.instance.data) if self.partial else {}
+        blob = dict(_loads_blob(self.instance.data)) if self.partial else {}
         structured_attrs = {}
 
         # Pull off any fields that the serlializer doesn't know about directly
         # and put them into the data blob.
-        known_fields = set(self.fields.keys())
-
-        # And allow an arbitrary value field named 'data' (don't let the
-        # data blob get in the way).
-        known_fields.remove('data')
+        known_fields = self.get_known_fields()
 
         # Split the incoming data into stuff that will be set straight onto
         # preexisting fields, and stuff that will go into the data blob.
@@ -292,10 +463,10 @@ class DataBlobProcessor (EmptyModelSerializer):
             else:
                 blob[key] = data[key]
 
-        structured_attrs['data'] = json.dumps(blob)
+        structured_attrs['data'] = _dumps(blob)
 
         if not self.partial:
-            for field_name, field in list(self.fields.items()):
+            for field_name, field in self.fields.items():
                 if not field.read_only:
                     structured_attrs.setdefault(field_name, field.default)
 
@@ -306,13 +477,12 @@ class DataBlobProcessor (EmptyModelSerializer):
         Pull the 'data' attribute off of the representation, parse it, and add
         its attributes directly into the representation.
         """
-        blob = json.loads(data.pop('data'))
+        blob = _loads_blob(data.pop('data'))
 
         # Did the user not ask for private data? Remove it!
         if not self.is_flag_on(INCLUDE_PRIVATE_PARAM):
-            for key in list(blob.keys()):
-                if key.startswith('private'):
-                    del blob[key]
+            blob = {key: value for key, value in blob.items()
+                    if not key.startswith('private')}
 
         data.update(blob)
         return data
@@ -333,6 +503,8 @@ class DataBlobProcessor (EmptyModelSerializer):
 #
 
 class DefaultUserDataStrategy (object):
+    __slots__ = ()
+
     def extract_avatar_url(self, user_info):
         return ''
 
@@ -343,12 +515,16 @@ class DefaultUserDataStrategy (object):
         return ''
 
 
+_TWITTER_AVATAR_RE = re.compile(r'^(?P<path>.*?)(?:_normal|_mini|_bigger|)(?P<ext>\.[^\.]*)$')
+
+
 class TwitterUserDataStrategy (object):
+    __slots__ = ()
+
     def extract_avatar_url(self, user_info):
         url = user_info['profile_image_url']
 
-        url_pattern = '^(?P<path>.*?)(?:_normal|_mini|_bigger|)(?P<ext>\.[^\.]*)$'
-        match = re.match(url_pattern, url)
+        match = _TWITTER_AVATAR_RE.match(url)
         if match:
             return match.group('path') + '_bigger' + match.group('ext')
         else:
@@ -362,6 +538,8 @@ class TwitterUserDataStrategy (object):
 
 
 class FacebookUserDataStrategy (object):
+    __slots__ = ()
+
     def extract_avatar_url(self, user_info):
         url = user_info['picture']['data']['url']
         return url
@@ -379,6 +557,8 @@ class ShareaboutsUserDataStrategy (object):
     that already exist in the system without them creating a Twitter or
     Facebook account.
     """
+    __slots__ = ()
+
     def extract_avatar_url(self, user_info):
         return user_info.get('avatar_url', None)
 
@@ -389,6 +569,72 @@ class ShareaboutsUserDataStrategy (object):
         return user_info.get('bio', None)
 
 
+def _attachment_to_dict(attachment):
+    """
+    Build the same representation as AttachmentSerializer, without the
+    overhead of constructing a serializer for every attachment. Datetimes are
+    formatted here, rather than by the renderer, so that the result matches
+    the serializer's.
+    """
+    return {
+        'created_datetime': datetime_to_string(attachment.created_datetime),
+        'updated_datetime': datetime_to_string(attachment.updated_datetime),
+        'file': storage_url(attachment.file.storage, attachment.file.name),
+        'name': attachment.name,
+    }
+
+
+def _get_user_social_info(user, strategies, default_strategy, social_info_cache):
+    """
+    Return the user's social auth extra data, the strategy for reading it, and
+    the user's provider type and id. The result is memoized by user id in
+    social_info_cache. Each serializer keeps its own cache, so cached results
+    are never shared between serializers with different strategies.
+    """
+    if user.pk is not None:
+        try:
+            return social_info_cache[user.pk]
+        except KeyError:
+            pass
+
+    user_data, strategy = None, default_strategy
+    for social_auth in user.social_auth.all():
+        provider_strategy = strategies.get(social_auth.provider)
+        if provider_strategy is not None:
+            user_data, strategy = social_auth.extra_data, provider_strategy
+            break
+
+    provider_type, provider_id = '', None
+    for social_auth in user.social_auth.all():
+        provider_type, provider_id = social_auth.provider, social_auth.uid
+        break
+
+    social_info = (user_data, strategy, provider_type, provider_id)
+    if user.pk is not None:
+        social_info_cache[user.pk] = social_info
+    return social_info
+
+
+def _user_to_dict(user, strategies, default_strategy, social_info_cache):
+    """
+    Build the same representation as BaseUserSerializer, without the overhead
+    of constructing a serializer for every user.
+    """
+    if not user:
+        return None
+
+    user_data, strategy, provider_type, provider_id = _get_user_social_info(
+        user, strategies, default_strategy, social_info_cache)
+    return {
+        "name": strategy.extract_full_name(user_data),
+        "avatar_url": strategy.extract_avatar_url(user_data),
+        "provider_type": provider_type,
+        "provider_id": provider_id,
+        "id": user.id,
+        "username": user.username
+    }
+
+
 ###############################################################################
 #
 # Serializers
@@ -506,13 +752,16 @@ class BaseUserSerializer (serializers.ModelSerializer):
         model = models.User
         exclude = ('first_name', 'last_name', 'email', 'password', 'is_staff', 'is_active', 'is_superuser', 'last_login', 'date_joined', 'user_permissions')
 
-    def get_strategy(self, obj):
-        for social_auth in obj.social_auth.all():
-            provider = social_auth.provider
-            if provider in self.strategies:
-                return social_auth.extra_data, self.strategies[provider]
+    def __init__(self, *args, **kwargs):
+        super(BaseUserSerializer, self).__init__(*args, **kwargs)
+        # Social auth data for each user, by user id; see
+        # _get_user_social_info.
+        self._social_info = {}
 
-        return None, self.default_strategy
+    def get_strategy(self, obj):
+        user_data, strategy, _, _ = _get_user_social_info(
+            obj, self.strategies, self.default_strategy, self._social_info)
+        return user_data, strategy
 
     def get_name(self, obj):
         user_data, strategy = self.get_strategy(obj)
@@ -641,34 +890,49 @@ class DataSetSubmissionSetSummarySerializer (serializers.HyperlinkedModelSeriali
 
         # Otherwise, check the request parameters for the flag
         request = self.context['request']
-        param = request.GET.get(flagname, 'false')
-        return param.lower() not in ('false', 'no', 'off')
+        return is_request_flag_on(request, flagname)
 
     def get_submission_sets(self, dataset):
+        """
+        Return a dictionary whose key is the dataset id and whose value is a
+        mapping from submission set name to the number of submissions in that
+        set. The counts are computed in a single query instead of loading
+        every submission in the dataset.
+        """
         include_invisible = self.is_flag_on(INCLUDE_INVISIBLE_PARAM)
-        submission_sets = defaultdict(list)
-        for submission in dataset.submissions.all():
-            if include_invisible or submission.visible:
-                set_name = submission.set_name
-                submission_sets[set_name].append(submission)
-        return {dataset.id: submission_sets}
+        submissions = dataset.submissions
+        if not include_invisible:
+            submissions = submissions.filter(visible=True)
+
+        # Unset any default ordering
+        submissions = submissions.order_by()
+
+        summaries = submissions.values('set_name').annotate(length=Count('id'))
+        return {dataset.id: {summary['set_name']: summary['length'] for summary in summaries}}
 
     def to_representation(self, obj):
         request = self.context['request']
+        user = getattr(request, 'user', None)
+        client = getattr(request, 'client', None)
+        url_field = self.fields['url']
+
         submission_sets_map = self.get_submission_sets(obj)
         sets = submission_sets_map.get(obj.id, {})
         summaries = {}
-        for set_name, submission_set in sets.items():
+        for set_name, set_length in sets.items():
             # Ensure the user has read permission on the submission set.
-            user = getattr(request, 'user', None)
-            client = getattr(request, 'client', None)
-            dataset = obj
-            if not check_data_permission(user, client, 'retrieve', dataset, set_name):
+            if not check_data_permission(user, client, 'retrieve', obj, set_name):
                 continue
 
+            # Build the summary directly instead of running the full
+            # serializer machinery for each set. The set's URL depends on
+            # the submission_set_name attribute.
             obj.submission_set_name = set_name
-            obj.submission_set_length = len(submission_set)
-            summaries[set_name] = super(DataSetSubmissionSetSummarySerializer, self).to_representation(obj)
+            obj.submission_set_length = set_length
+            summaries[set_name] = OrderedDict([
+                ('length', set_length),
+                ('url', url_field.to_representation(obj)),
+            ])
         return summaries
 
 
@@ -700,8 +964,7 @@ class SubmittedThingSerializer (bulk_serializers.BulkSerializerMixin, ActivityGe
 
         # Otherwise, check the request parameters for the flag
         request = self.context['request']
-        param = request.GET.get(flagname, 'false')
-        return param.lower() not in ('false', 'no', 'off')
+        return is_request_flag_on(request, flagname)
 
     def _patch_submitter(self, instance=None, data={}):
         """
@@ -740,13 +1003,25 @@ class BasePlaceSerializer (SubmittedThingSerializer, serializers.ModelSerializer
         list_serializer_class = bulk_serializers.BulkListSerializer
         update_lookup_field = 'url'
 
+    def __init__(self, *args, **kwargs):
+        super(BasePlaceSerializer, self).__init__(*args, **kwargs)
+        # The same serializer instance is used for every place on a page, so
+        # social auth data for repeat submitters is only processed once.
+        self._submitter_social_info = {}
+
     def get_submission_sets(self, place):
-        include_invisible = self.is_flag_on(INCLUDE_INVISIBLE_PARAM)
+        """
+        Group the place's submissions by set name. Views should prefetch
+        'submissions' so that this reads from the prefetch cache instead of
+        querying once per place.
+        """
+        submissions = place.submissions.all()
+        if not self.is_flag_on(INCLUDE_INVISIBLE_PARAM):
+            submissions = [s for s in submissions if s.visible]
+
         submission_sets = defaultdict(list)
-        for submission in place.submissions.all():
-            if include_invisible or submission.visible:
-                set_name = submission.set_name
-                submission_sets[set_name].append(submission)
+        for submission in submissions:
+            submission_sets[submission.set_name].append(submission)
         return submission_sets
 
     def summary_to_representation(self, set_name, submissions):
@@ -761,14 +1036,14 @@ class BasePlaceSerializer (SubmittedThingSerializer, serializers.ModelSerializer
         Get this for the entire dataset at once.
         """
         request = self.context['request']
+        user = getattr(request, 'user', None)
+        client = getattr(request, 'client', None)
+        dataset = getattr(request, 'get_dataset', lambda: None)()
 
         submission_sets = self.get_submission_sets(place)
         summaries = {}
         for set_name, submissions in submission_sets.items():
             # Ensure the user has read permission on the submission set.
-            user = getattr(request, 'user', None)
-            client = getattr(request, 'client', None)
-            dataset = getattr(request, 'get_dataset', lambda: None)()
             if not check_data_permission(user, client, 'retrieve', dataset, set_name):
                 continue
 
@@ -787,14 +1062,14 @@ class BasePlaceSerializer (SubmittedThingSerializer, serializers.ModelSerializer
         Get this for the entire dataset at once.
         """
         request = self.context['request']
+        user = getattr(request, 'user', None)
+        client = getattr(request, 'client', None)
+        dataset = getattr(request, 'get_dataset', lambda: None)()
 
         submission_sets = self.get_submission_sets(place)
         details = {}
         for set_name, submissions in submission_sets.items():
             # Ensure the user has read permission on the submission set.
-            user = getattr(request, 'user', None)
-            client = getattr(request, 'client', None)
-            dataset = getattr(request, 'get_dataset', lambda: None)()
             if not check_data_permission(user, client, 'retrieve', dataset, set_name):
                 continue
 
@@ -808,10 +1083,13 @@ class BasePlaceSerializer (SubmittedThingSerializer, serializers.ModelSerializer
         return details
 
     def attachments_to_representation(self, obj):
-        return [AttachmentSerializer(a).data for a in obj.attachments.all()]
+        return [_attachment_to_dict(a) for a in obj.attachments.all()]
 
     def submitter_to_representation(self, obj):
-        return SimpleUserSerializer(obj.submitter).data if obj.submitter else None
+        return _user_to_dict(obj.submitter,
+                             BaseUserSerializer.strategies,
+                             BaseUserSerializer.default_strategy,
+                             self._submitter_social_info)
 
     def to_representation(self, obj):
         obj = self.ensure_obj(obj)
@@ -825,8 +1103,9 @@ class BasePlaceSerializer (SubmittedThingSerializer, serializers.ModelSerializer
             'submitter': self.submitter_to_representation(obj),
             'data': obj.data,
             'visible': obj.visible,
-            'created_datetime': obj.created_datetime.isoformat() if obj.created_datetime else None,
-            'updated_datetime': obj.updated_datetime.isoformat() if obj.updated_datetime else None,
+            # Datetimes are left for the renderer to format.
+            'created_datetime': obj.created_datetime,
+            'updated_datetime': obj.updated_datetime,
         }
 
         if 'url' in fields:
@@ -878,9 +1157,6 @@ class PlaceSerializer (BasePlaceSerializer, serializers.HyperlinkedModelSerializ
         serializer.bind(parent=self, field_name='submission_set')
         return serializer.data
 
-    def submitter_to_representation(self, obj):
-        return UserSerializer(obj.submitter).data if obj.submitter else None
-
 
 # Submission serializers
 class BaseSubmissionSerializer (SubmittedThingSerializer, serializers.ModelSerializer):
@@ -2,7 +2,36 @@
 
 from django.test import TestCase
 from nose.tools import istest
-from sa_api_v2.renderers import GeoJSONRenderer
+from datetime import datetime
+from django.utils.timezone import utc
+from sa_api_v2.renderers import GeoJSONRenderer, JSONRenderer
+import json
+
+
+class TestJSONRenderer (TestCase):
+
+    def test_datetimes_are_rendered_as_iso_8601(self):
+        renderer = JSONRenderer()
+        data = {'created_datetime': datetime(2013, 5, 1, 20, 41, 34, 97000, tzinfo=utc)}
+
+        result = json.loads(renderer.render(data).decode('utf-8'))
+        self.assertEqual(result, {'created_datetime': '2013-05-01T20:41:34.097000Z'})
+
+    def test_indented_datetimes_match_compact_datetimes(self):
+        renderer = JSONRenderer()
+        data = {
+            'created_datetime': datetime(2013, 5, 1, 20, 41, 34, 97000, tzinfo=utc),
+            'updated_datetime': datetime(2013, 5, 1, 20, 41, 34),
+        }
+
+        compact = json.loads(renderer.render(data).decode('utf-8'))
+        indented = json.loads(renderer.render(data, 'application/json; indent=4').decode('utf-8'))
+        self.assertEqual(indented, compact)
+        self.assertEqual(indented, {
+            'created_datetime': '2013-05-01T20:41:34.097000Z',
+            'updated_datetime': '2013-05-01T20:41:34Z',
+        })
+
 
 class TestGeoJSONRenderer (TestCase):
 
@@ -3,12 +3,13 @@
 from django.test import TestCase
 from django.test.client import RequestFactory
 from django.contrib.gis.geos import GEOSGeometry
+from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 from rest_framework.reverse import reverse
 from nose.tools import istest
 from sa_api_v2.cache import cache_buffer
 from sa_api_v2.models import Attachment, Action, User, DataSet, Place, Submission, Group
-from sa_api_v2.serializers import AttachmentSerializer, ActionSerializer, UserSerializer, FullUserSerializer, PlaceSerializer, DataSetSerializer, SubmissionSerializer
+from sa_api_v2.serializers import AttachmentSerializer, ActionSerializer, UserSerializer, FullUserSerializer, PlaceSerializer, DataSetSerializer, SubmissionSerializer, storage_url, template_reverse, GeometryField
 from sa_api_v2.views import PlaceInstanceView
 from social_django.models import UserSocialAuth
 import json
@@ -16,6 +17,72 @@ from os import path
 from mock import patch
 
 
+class TestTemplateReverse (TestCase):
+
+    url_arg_names = ('owner_username', 'dataset_slug', 'place_id')
+    url_kwargs = {'owner_username': 'myuser', 'dataset_slug': 'data', 'place_id': 123}
+
+    def test_matches_reverse_without_a_request(self):
+        self.assertEqual(
+            template_reverse('place-detail', self.url_arg_names, self.url_kwargs),
+            reverse('place-detail', kwargs=self.url_kwargs))
+
+    def test_matches_reverse_with_a_request(self):
+        request = RequestFactory().get('')
+        self.assertEqual(
+            template_reverse('place-detail', self.url_arg_names, self.url_kwargs, request=request),
+            reverse('place-detail', kwargs=self.url_kwargs, request=request))
+
+    def test_preserves_the_format_query_param(self):
+        request = RequestFactory().get('', {'format': 'json'})
+        url = template_reverse('place-detail', self.url_arg_names, self.url_kwargs, request=request)
+        self.assertEqual(url, reverse('place-detail', kwargs=self.url_kwargs, request=request))
+        self.assertTrue(url.endswith('?format=json'))
+
+    def test_values_that_look_like_placeholders_are_not_substituted(self):
+        kwargs = {'owner_username': '91827364501', 'dataset_slug': '91827364502', 'place_id': 123}
+        self.assertEqual(
+            template_reverse('place-detail', self.url_arg_names, kwargs),
+            reverse('place-detail', kwargs=kwargs))
+
+
+class TestGeometryField (TestCase):
+
+    def test_dict_representation_of_a_point(self):
+        field = GeometryField(format='dict')
+        self.assertEqual(field.to_representation(GEOSGeometry('POINT(2 3)')),
+                         {'type': 'Point', 'coordinates': [2.0, 3.0]})
+
+    def test_dict_representation_of_an_empty_point(self):
+        field = GeometryField(format='dict')
+        point = GEOSGeometry('POINT EMPTY')
+        self.assertEqual(field.to_representation(point), json.loads(point.json))
+
+    def test_dict_point_to_internal_value(self):
+        field = GeometryField(format='dict')
+        point = field.to_internal_value({'type': 'Point', 'coordinates': [2, 3]})
+        self.assertEqual(point.srid, 4326)
+        self.assertEqual(point.coords, (2.0, 3.0))
+
+    def test_dict_point_with_crs_to_internal_value(self):
+        field = GeometryField(format='dict')
+        data = {
+            'type': 'Point',
+            'coordinates': [222638.98, 334111.17],
+            'crs': {'type': 'name', 'properties': {'name': 'EPSG:3857'}},
+        }
+        point = field.to_internal_value(data)
+        expected = GEOSGeometry(json.dumps(data))
+        self.assertEqual(point.srid, expected.srid)
+        self.assertEqual(point.coords, (222638.98, 334111.17))
+
+    def test_dict_point_with_malformed_coordinates_is_invalid(self):
+        field = GeometryField(format='dict')
+        for coords in ([[1, 2], [3, 4]], [None, 5], [True, False]):
+            with self.assertRaises(ValidationError):
+                field.to_internal_value({'type': 'Point', 'coordinates': coords})
+
+
 class TestAttachmentSerializer (TestCase):
 
     def setUp(self):
@@ -33,6 +100,11 @@ class TestAttachmentSerializer (TestCase):
         self.assertIn('file', serializer.data)
         self.assertIn('name', serializer.data)
 
+    def test_file_url_matches_storage_url(self):
+        storage = self.attachment_model.file.storage
+        name = 'attachments/abc123-my_file.txt'
+        self.assertEqual(storage_url(storage, name), storage.url(name))
+
     def test_can_serlialize_a_null_instance(self):
         serializer = AttachmentSerializer(None)
         data = serializer.data
@@ -243,6 +315,21 @@ class TestPlaceSerializer (TestCase):
 
         self.assertEqual(serializer.data['submission_sets']['comments']['length'], 2)
 
+    def test_place_submitter_and_attachments_match_their_serializers(self):
+        request = RequestFactory().get('')
+        request.get_dataset = lambda: self.dataset
+
+        self.place.submitter = self.owner
+        self.place.save()
+        f = ContentFile('this is a test')
+        f.name = 'my_file.txt'
+        attachment = Attachment.objects.create(name='my_file', file=f, thing=self.place)
+
+        serializer = PlaceSerializer(self.place, context={'request': request})
+
+        self.assertEqual(serializer.data['submitter'], UserSerializer(self.owner).data)
+        self.assertEqual(serializer.data['attachments'], [AttachmentSerializer(attachment).data])
+
     def test_place_hides_private_data_by_default(self):
         request = RequestFactory().get('')
         request.get_dataset = lambda: self.dataset
@@ -21,6 +21,21 @@ def isiterable(obj):
     else:
         return True
 
+def datetime_to_string(value):
+    """
+    Format a datetime the way orjson does with OPT_NAIVE_UTC | OPT_UTC_Z:
+    RFC 3339, keeping microseconds, with naive datetimes treated as UTC and
+    a UTC offset written as Z. None stays None.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.isoformat() + 'Z'
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
 def to_distance(string):
     try:
         number = float(string)
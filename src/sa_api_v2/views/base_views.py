@@ -16,7 +16,7 @@ from rest_framework import (views, permissions, mixins, authentication,
 from rest_framework.negotiation import DefaultContentNegotiation
 from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
 from rest_framework.response import Response
-from rest_framework.renderers import JSONRenderer, BrowsableAPIRenderer
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.request import Request
 from rest_framework.exceptions import APIException
 from rest_framework_bulk import generics as bulk_generics
@@ -568,7 +568,7 @@ class OwnedResourceMixin (ClientAuthenticationMixin, CorsEnabledMixin):
     logged in directly is allowed to read invisible resources or private data
     attributes on visible resources.
     """
-    renderer_classes = (JSONRenderer, renderers.JSONPRenderer, BrowsableAPIRenderer, renderers.PaginatedCSVRenderer)
+    renderer_classes = (renderers.JSONRenderer, renderers.JSONPRenderer, BrowsableAPIRenderer, renderers.PaginatedCSVRenderer)
     parser_classes = (JSONParser, FormParser, MultiPartParser)
     permission_classes = (IsOwnerOrReadOnly, IsAllowedByDataPermissions)
     authentication_classes = (authentication.BasicAuthentication, ShareaboutsSessionAuth)
@@ -950,15 +950,22 @@ class PlaceInstanceView (CachedResourceMixin, LocatedResourceMixin, OwnedResourc
     parser_classes = (parsers.GeoJSONParser,) + OwnedResourceMixin.parser_classes[1:]
 
     def get_object_or_404(self, pk):
+        queryset = self.queryset.model.objects\
+            .filter(pk=pk)\
+            .select_related('dataset', 'dataset__owner', 'submitter')\
+            .prefetch_related('submitter__social_auth',
+                              'submissions',
+                              'submissions__attachments',
+                              'attachments')
+
+        if INCLUDE_SUBMISSIONS_PARAM in self.request.GET:
+            queryset = queryset.prefetch_related(
+                'submissions__submitter',
+                'submissions__submitter__social_auth',
+                'submissions__submitter___groups')
+
         try:
-            return self.queryset.model.objects\
-                .filter(pk=pk)\
-                .select_related('dataset', 'dataset__owner', 'submitter')\
-                .prefetch_related('submitter__social_auth',
-                                  'submissions',
-                                  'submissions__attachments',
-                                  'attachments')\
-                .get()
+            return queryset.get()
         except self.queryset.model.DoesNotExist:
             raise Http404
 
@@ -1533,7 +1540,7 @@ class DataSetListMixin (object):
         for summary in summaries:
             sets[summary['dataset']].append(summary)
 
-        return dict(list(sets.items()))
+        return dict(sets)
 
 
 class DataSetListView (DataSetListMixin, SerializerParamsMixin, ProtectedOwnedResourceMixin, generics.ListCreateAPIView):
@@ -1920,7 +1927,7 @@ class CurrentUserInstanceView (CorsEnabledMixin, views.APIView):
 
 
 class SessionKeyView (CorsEnabledMixin, views.APIView):
-    renderer_classes = (JSONRenderer, renderers.JSONPRenderer, BrowsableAPIRenderer)
+    renderer_classes = (renderers.JSONRenderer, renderers.JSONPRenderer, BrowsableAPIRenderer)
     content_negotiation_class = ShareaboutsContentNegotiation
 
     def get(self, request):